@@ -0,0 +1,75 @@
+"""Time the XML and JSON exports on a synthetic tree.
+
+Run with `python benchmarks/bench_export.py [nodes] [values]` once pyvba is installed (`pip install -e .`).
+No COM application is needed; the tree is built from browsers holding their values directly. The
+default is 1,000 nodes of 1,000 values each, a million values in all. Each row is the time in seconds
+to build `data_str` and `data_min` with a fresh exporter, in both the VBA and dict forms. Run the same
+script against an older checkout to compare implementations.
+"""
+import sys
+import time
+from types import SimpleNamespace
+
+from pyvba.browser import Browser, visited
+from pyvba.export import XMLExport, JSONExport
+
+NODES = 1000
+VALUES = 1000
+
+
+def node(name: str, com_type: str, **values) -> Browser:
+    """Return a browser holding the given values, with only its name behind it in place of a COM object."""
+    browser = Browser.__new__(Browser)
+    browser.__dict__.update(
+        _com=SimpleNamespace(Name=name), _name=name, _type=com_type, _parent=None, _objects=list(values),
+        _methods=[], _errors={}, _all=values, _released=False,
+    )
+    return browser
+
+
+def value(i: int, j: int):
+    """Return a mix of integers, floats, booleans, and strings needing escapes."""
+    kind = j % 4
+    if kind == 0:
+        return i * j
+    elif kind == 1:
+        return i / (j + 1)
+    elif kind == 2:
+        return (i + j) % 2 == 0
+    return f'val "{i}" & <{j}>\n'
+
+
+def tree(nodes: int, values: int) -> Browser:
+    """Return a root holding a collection of nodes, registered in `visited` for the dict forms."""
+    pads = [
+        node(f"Pad.{i}", "Pad", Name=f"Pad.{i}", **{f"P{j}": value(i, j) for j in range(values - 1)})
+        for i in range(nodes)
+    ]
+    root = node("App", "Application", Name="App", Pads=pads)
+
+    visited.clear()
+    visited["Pad"] = list(pads)
+    return root
+
+
+def bench(func) -> float:
+    """Return the time of a single call in seconds."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main(nodes: int = NODES, values: int = VALUES):
+    root = tree(nodes, values)
+    print(f"{nodes} nodes x {values} values")
+    print(f"{'export':12s} {'form':5s} {'data_str':>10s} {'data_min':>10s}")
+    for cls in (XMLExport, JSONExport):
+        for vba_form in (True, False):
+            data_str = bench(lambda: cls(root, vba_form=vba_form).data_str)
+            data_min = bench(lambda: cls(root, vba_form=vba_form).data_min)
+            form = 'vba' if vba_form else 'dict'
+            print(f"{cls.__name__:12s} {form:5s} {data_str:9.2f}s {data_min:9.2f}s")
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:3]))
@@ -0,0 +1,60 @@
+"""Time how long Viewer.gettype takes to classify values.
+
+Run with `python benchmarks/bench_gettype.py` once pyvba is installed (`pip install -e .`). No COM
+application is needed; the values are the kinds returned by property reads. Each row is the time per
+call in nanoseconds.
+
+`gettype` wraps COM objects in a Viewer, which needs a live COM object, so the dispatch row only times
+`kind`, the classification `gettype` performs before wrapping.
+"""
+import timeit
+
+from win32com.client.dynamic import CDispatch
+
+from pyvba.viewer import Viewer
+
+NUMBER = 200000
+
+
+class Member:
+    def Select(self, x):
+        return x
+
+
+class Dispatch(CDispatch):
+    def __init__(self, members=()):
+        """A late-bound object without an IDispatch behind it, answering member lookups from a set."""
+        self.__dict__['_members'] = set(members)
+
+    def _find_dispatch_type_(self, methodName):
+        return (1, 1) if methodName in self._members else (None, None)
+
+
+VALUES = {
+    'int': 1,
+    'float': 2.5,
+    'bool': True,
+    'str': "Pad.1" * 4,
+    'tuple': (1.0, 2.0, 3.0),
+    'None': None,
+    'method': Member().Select,
+    'dispatch': Dispatch(['Count']),
+}
+
+
+def bench(func, number: int = NUMBER) -> float:
+    """Return the mean time of a call in nanoseconds."""
+    return timeit.timeit(func, number=number) / number * 1e9
+
+
+def main():
+    print(f"{'value':8s} {'gettype':>10s} {'kind':>10s} {'classify':>10s}")
+    for name, value in VALUES.items():
+        cls = type(value)
+        gettype = f"{bench(lambda: Viewer.gettype(value)):8.1f}ns" if name != 'dispatch' else f"{'-':>10s}"
+        print(f"{name:8s} {gettype} {bench(lambda: Viewer.kind(value)):8.1f}ns "
+              f"{bench(lambda: Viewer.classify(cls)):8.1f}ns")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,8 @@
 from .viewer import Viewer, FunctionViewer, CollectionViewer
-from .browser import Browser, CollectionBrowser
-from .export import ExportStr, XMLExport, JSONExport
+from .browser import Browser, CollectionBrowser, Record
+from .policy import SkipPolicy
+from .sampler import Sampler
+from .progress import Progress, JSONLinesLogger
+from .index import Index
+from .traversal import Traversal, Sink, StatsSink
+from .export import ExportStr, XMLExport, JSONExport, SQLiteExport, XMLSink, JSONSink, SQLiteSink
@@ -1,12 +1,58 @@
-from pyvba.viewer import Viewer, FunctionViewer, CollectionViewer
+import gc
+import time
+import weakref
 from collections import OrderedDict
 
+import win32api
+import win32process
+
+from pyvba.policy import SkipPolicy
+from pyvba.progress import Progress
+from pyvba.viewer import Viewer, FunctionViewer, CollectionViewer
+
 # used to skip predetermined objects by exact name
 skip = ['Application', 'Parent']
 
 # store a dictionary of the discovered items
 visited = OrderedDict()
 
+# skip members of a type that are repeatedly slow or raise errors
+policy = None
+
+# track the throughput of browsing for observers
+progress = Progress()
+
+# release COM references once browsed, compact consumed subtrees, and keep under a working set ceiling (in
+# bytes) when bounded
+bounded = False
+max_memory = None
+
+
+class WeakList:
+    def __init__(self):
+        """A list-like container holding weak references to its items.
+
+        Used in place of a list in the visited dictionary when browsing is bounded, so the dictionary
+        does not keep browsers alive on its own. Dead references are skipped during iteration.
+        """
+        self._refs = []
+
+    def __iter__(self):
+        for ref in self._refs:
+            item = ref()
+            if item is not None:
+                yield item
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __contains__(self, item):
+        return any(item is i for i in self)
+
+    def append(self, item):
+        """Add a weak reference to the item."""
+        self._refs.append(weakref.ref(item))
+
 
 class Browser(Viewer):
     def __init__(self, app, name: str, parent: Viewer = None):
@@ -22,11 +68,17 @@ class Browser(Viewer):
         """
         super().__init__(app, name, parent)
         self._all = {}
+        self._released = False
 
     def __str__(self):
         return super().__str__().replace('Viewer', 'Browser')
 
     def __getattr__(self, item):
+        if self._released:
+            if item in self._all:
+                return self._all[item]
+            raise AttributeError(f"'{item}' is unavailable; the browser '{self._name}' has been released")
+
         if self._all == {}:
             self._generate()
 
@@ -67,25 +119,127 @@ class Browser(Viewer):
         global skip
         skip = ['Application', 'Parent']
 
+    @staticmethod
+    def set_policy(skip_policy: SkipPolicy = None):
+        """Set the policy used to skip slow or failing members. A new default policy is used if none is given."""
+        global policy
+        policy = skip_policy if skip_policy is not None else SkipPolicy()
+        return policy
+
+    @staticmethod
+    def clr_policy():
+        """Stop skipping members adaptively."""
+        global policy
+        policy = None
+
+    @staticmethod
+    def observe(callback, interval: float = None) -> Progress:
+        """Report browsing metrics to a callback at an interval (in seconds) and return the tracker.
+
+        The callback receives a dict of nodes, properties, errors, queue depth, and nodes per second.
+        Use `pyvba.JSONLinesLogger()` as the callback to log the metrics as lines of JSON.
+        """
+        if interval is not None:
+            progress.interval = interval
+        progress.subscribe(callback)
+        return progress
+
+    @staticmethod
+    def clr_observers():
+        """Stop reporting browsing metrics."""
+        for callback in list(progress.observers):
+            progress.unsubscribe(callback)
+
+    @staticmethod
+    def bound(limit: int = None):
+        """Keep browsing within a bounded amount of memory.
+
+        Each browser releases its COM references once generated, and `visited` holds weak references. A
+        `Traversal` (used by the VBA-form exports) replaces each browser in its parent's `all` with a `Record`
+        once its events have been sent to the sinks, so only the current path is held in full. Export
+        directly rather than calling `browse_all` first, and run the sinks needed together since a compacted
+        tree cannot be exported again in full. The dict-form exports read `visited` and need the whole tree.
+
+        Parameters
+        ----------
+        limit: int
+            The working set ceiling in bytes. When it is passed, the subtrees already browsed are compacted
+            into records, and a MemoryError is raised only if that does not bring the working set back under.
+        """
+        global bounded, max_memory
+        bounded = True
+        max_memory = limit
+
+    @staticmethod
+    def unbound():
+        """Return to keeping every browser and its COM references for the whole session."""
+        global bounded, max_memory
+        bounded = False
+        max_memory = None
+
+    @staticmethod
+    def memory_usage() -> tuple:
+        """Return the current and peak working set (RSS) of the process in bytes."""
+        info = win32process.GetProcessMemoryInfo(win32api.GetCurrentProcess())
+        return info['WorkingSetSize'], info['PeakWorkingSetSize']
+
+    @staticmethod
+    def _over_ceiling() -> bool:
+        """Return True if the working set is above the ceiling after a garbage collection."""
+        if max_memory is None or Browser.memory_usage()[0] <= max_memory:
+            return False
+
+        gc.collect()
+        return Browser.memory_usage()[0] > max_memory
+
+    @staticmethod
+    def _check_memory():
+        """Raise a MemoryError if the working set is above the ceiling after a garbage collection."""
+        if Browser._over_ceiling():
+            rss, peak = Browser.memory_usage()
+            raise MemoryError(f"Working set of {rss} bytes exceeds the {max_memory} byte ceiling (peak {peak}).")
+
     @property
     def all(self) -> dict:
         """Return a dict of objects in the form `{name: item}`."""
-        if self._all == {}:
+        if self._all == {} and not self._released:
             self._generate()
         return self._all
 
+    @property
+    def generated(self) -> bool:
+        """Return True if the `all` property has been populated."""
+        return self._all != {}
+
+    @property
+    def released(self) -> bool:
+        """Return True if the COM references have been released."""
+        return self._released
+
     def _generate(self):
         """Iterates through all objects when called upon."""
-        global skip, visited
+        global skip, visited, policy
+        read, errors = 0, len(self._errors)
 
         # iterate through items
         for name in self._objects + [i.name for i in self._methods]:
-            if name in skip:
+            if name in skip or (policy is not None and policy.skipped(self._type, name)):
                 continue
 
+            read += 1
+            start = time.perf_counter()
             try:
                 obj = super().getattr(name)
+            except KeyboardInterrupt:
+                raise
+            except BaseException as e:
+                self._record(name, start, e)
+                self._errors[name] = e.args
+                continue
 
+            # record the read once; errors while wrapping the result are not counted against the member
+            self._record(name, start, obj)
+            try:
                 if isinstance(obj, Viewer):
                     self._all[name] = self.from_viewer(obj, self)
                 else:
@@ -100,37 +254,180 @@ class Browser(Viewer):
         for name, value in self._all.items():
             if isinstance(value, Viewer):
                 if value.type not in visited:
-                    visited[value.type] = []
+                    visited[value.type] = WeakList() if bounded else []
 
                 if not any(map(lambda item: value.cf(item), visited[value.type])):
                     visited[value.type].append(value)
 
+        progress.node(read, len(self._errors) - errors)
+
+        if bounded:
+            self.release()
+
+    def _record(self, name: str, start: float, obj):
+        """Report the duration and outcome of reading a member to the skip policy, if one is set."""
+        if policy is not None:
+            error = obj if isinstance(obj, BaseException) else None
+            policy.record(self._type, name, time.perf_counter() - start, error)
+
     def browse_all(self):
-        """Populate the browser and all descendents of the browser."""
-        if self._all == {}:
-            self._generate()
+        """Populate the browser and all descendents of the browser.
 
-        # populate child browsers if not already visited
-        for name, value in self._all.items():
-            if isinstance(value, Browser) and not any(map(lambda item: value.cf(item), visited[value.type])):
-                name.browse_all()
+        When bounded, each browser is released once generated and browsers already found elsewhere
+        are released without being populated. If the working set passes the ceiling, the children browsed
+        so far are compacted into records, level by level up the tree, and a MemoryError is raised only if
+        the working set is still above the ceiling at the root.
+        """
+        progress.begin()
+        try:
+            if self._all == {} and not self._released:
+                self._generate()
+
+            children = [
+                child
+                for value in self._all.values()
+                for child in (value if isinstance(value, list) else [value])
+                if isinstance(child, Browser)
+            ]
+            progress.queue(len(children))
+
+            # populate child browsers if they are the visited instance
+            for i, child in enumerate(children):
+                progress.queue(-1)
+
+                try:
+                    if any(map(lambda item: child is item, visited.get(child.type, []))):
+                        child.browse_all()
+                    elif bounded:
+                        child.release()
+
+                    if self._over_ceiling():
+                        self.compact(children[:i + 1])
+                        self._check_memory()
+                except MemoryError:
+                    # compact at this level too and carry on if that is enough
+                    self.compact(children[:i + 1])
+                    self._check_memory()
+        finally:
+            progress.end()
 
     def cf(self, other) -> bool:
         """Comparison alternative to __eq__.
 
         The comparison avoids checking any Viewer instances and compares the values of the standard objects within.
         """
-        return super().cf(other) and all([
+        if isinstance(other, Record):
+            return other.cf(self)
+        return super().cf(other) and all(
             a == b
             for a, b in zip(self._all.values(), other.all.values())
             if not isinstance(a, (Viewer, FunctionViewer, list)) and not isinstance(b, (Viewer, FunctionViewer, list))
-        ])
+        )
 
     def regen(self):
         """Regenerate the `all` property."""
+        if self._released:
+            raise RuntimeError(f"The browser '{self._name}' has been released and cannot be regenerated.")
+
         self._all = {}
         self._generate()
 
+    def release(self):
+        """Drop the COM object and bound methods so the host application can free them.
+
+        Values already in `all` remain available, including through attribute access. Use `compact` on
+        the parent to reduce the browser to a `Record`.
+        """
+        for value in self._all.values():
+            if isinstance(value, FunctionViewer):
+                value.release()
+
+        for method in self._methods:
+            method.release()
+
+        self._com = None
+        self._released = True
+
+    def compact(self, children: list = None):
+        """Replace child browsers in `all` with records of their plain values, dropping their subtrees.
+
+        Parameters
+        ----------
+        children: list
+            The browsers to replace. Every child browser is replaced if not given.
+        """
+        targets = None if children is None else {id(child) for child in children}
+        for name, value in self._all.items():
+            if isinstance(value, list):
+                for i, item in enumerate(value):
+                    if isinstance(item, Browser) and (targets is None or id(item) in targets):
+                        value[i] = Record(item)
+            elif isinstance(value, Browser) and (targets is None or id(value) in targets):
+                self._all[name] = Record(value)
+
+
+class Record:
+    __slots__ = ['_name', '_type', '_objects', '_all', '__weakref__']
+
+    def __init__(self, browser: Browser):
+        """A compact stand-in for a browser whose contents have been consumed.
+
+        Only the name, type, member names, and plain values are kept. Child browsers, collections,
+        functions, the COM object, and the parent link are dropped. A browser that was never generated
+        is not generated for its record.
+
+        Parameters
+        ----------
+        browser: Browser
+            The browser to reduce.
+        """
+        self._name = browser.name
+        self._type = browser.type
+        self._objects = browser.objects
+        self._all = {
+            name: value
+            for name, value in (browser.all.items() if browser.generated else ())
+            if not isinstance(value, (Viewer, FunctionViewer, Record, list))
+        }
+
+    def __str__(self):
+        return "<class 'Record'>: " + self._name
+
+    @property
+    def name(self) -> str:
+        """Return the name of the browser."""
+        return self._name
+
+    @property
+    def type(self) -> str:
+        """Return the type of the object within the COM object."""
+        return self._type
+
+    @property
+    def objects(self) -> list:
+        """Return a list of the objects."""
+        return self._objects
+
+    @property
+    def all(self) -> dict:
+        """Return a dict of the plain values in the form `{name: value}`."""
+        return self._all
+
+    def cf(self, other) -> bool:
+        """Comparison alternative to __eq__, matching a browser or record with the same plain values."""
+        if not isinstance(other, (Browser, Record)):
+            return False
+        if self._type != other.type or self._name != other.name or self._objects != other.objects:
+            return False
+
+        # like Browser.cf, only values already gathered are compared, so nothing is generated here
+        values = other.all if isinstance(other, Record) else other._all
+        return all(
+            values[name] == value
+            for name, value in self._all.items()
+            if name in values and not isinstance(values[name], (Viewer, FunctionViewer, Record, list))
+        )
+
 
 class CollectionBrowser(Browser, CollectionViewer):
     def __init__(self, obj):
@@ -153,7 +450,7 @@ class CollectionBrowser(Browser, CollectionViewer):
         for value in self._all['Item']:
             if isinstance(value, Viewer):
                 if value.type not in visited:
-                    visited[value.type] = []
+                    visited[value.type] = WeakList() if bounded else []
 
                 if value not in visited[value.type]:
                     visited[value.type].append(value)
@@ -1,10 +1,14 @@
 import os
-import re
 import copy
+import re
+import sqlite3
+import weakref
+from functools import lru_cache
 
 from win32com.universal import com_error
 
-from pyvba.browser import Browser, visited
+from pyvba.browser import Browser, Record, visited
+from pyvba.traversal import Sink, Traversal
 from pyvba.viewer import FunctionViewer
 
 
@@ -25,6 +29,7 @@ class ExportStr:
         """
         self._browser = browser
         self._data = None
+        self._data_min = None
 
         self._skip_func = skip_func
         self._skip_err = skip_err
@@ -40,22 +45,48 @@ class ExportStr:
     def data_min(self) -> str:
         """Return the data in a minimized string format.
 
-        The minimized version removes all newlines and tabs.
+        The minimized version is generated without the newlines and tabs used for layout.
         """
-        self._check()
-        return re.sub(r'\n*\t*', '', self._data)
+        self._check(minimize=True)
+        return self._data_min
 
-    def _check(self):
+    def _check(self, minimize: bool = False):
         """Check if the string needs to be generated."""
-        if self._data is None:
-            self._generate_vba() if self._vba_form else self._generate_dict()
+        self.generate(normal=not minimize, minimized=minimize)
+
+    def generate(self, normal: bool = True, minimized: bool = True):
+        """Generate the strings ahead of use; those already generated are kept.
+
+        In the VBA form, the forms requested together are built in a single traversal.
+
+        Parameters
+        ----------
+        normal: bool
+            A flag that determines if the normal string is generated.
+        minimized: bool
+            A flag that determines if the minimized string is generated.
+        """
+        forms = [
+            minimize
+            for minimize, wanted in ((False, normal), (True, minimized))
+            if wanted and (self._data_min if minimize else self._data) is None
+        ]
+        if len(forms) == 0:
+            return
+
+        data = self._generate_vba(*forms) if self._vba_form else [self._generate_dict(m) for m in forms]
+        for minimize, text in zip(forms, data):
+            if minimize:
+                self._data_min = text
+            else:
+                self._data = text
 
-    def _generate_vba(self, *args, **kwargs):
-        """Begin generating the string based on the VBA tree."""
+    def _generate_vba(self, *minimize: bool) -> list:
+        """Return a string based on the VBA tree for each form, minimized or not."""
         pass
 
-    def _generate_dict(self, *args, **kwargs):
-        """Begin generating the string based on the browser.visited dictionary."""
+    def _generate_dict(self, minimize: bool = False) -> str:
+        """Return the string based on the browser.visited dictionary."""
         pass
 
     def save_as(self, name: str, ext: str, path: str = '.\\', minimize: bool = False):
@@ -85,7 +116,6 @@ class ExportStr:
         minimize: bool
             A flag that determines if the data is returned in a minimized string format.
         """
-        self._check()
         print(self.data_str if not minimize else self.data_min)
 
 
@@ -97,6 +127,8 @@ class XMLExport(ExportStr):
         ">": "&gt;",
         "<": "&lt;",
     }
+    XML_ESCAPE_TABLE = str.maketrans(XML_ESCAPE_CHARS)
+    XML_ESCAPE_RE = re.compile(r'[&"\'<>]')
 
     def __init__(self, browser: Browser, version=1.0, encoding: str = "UTF-8", skip_func: bool = False,
                  skip_err: bool = False, vba_form: bool = False):
@@ -113,129 +145,64 @@ class XMLExport(ExportStr):
         """
         super().__init__(browser, skip_func, skip_err, vba_form)
 
-        self._xml_head = f'<?xml version="{str(version)}" encoding="{encoding}"?>\n'
+        self._xml_head = f'<?xml version="{str(version)}" encoding="{encoding}"?>'
 
     @staticmethod
     def xml_encode(text: str) -> str:
         """Map special XML characters to their encoded form in a given string."""
-        return "".join(XMLExport.XML_ESCAPE_CHARS.get(c, c) for c in str(text))
-
-    def _generate_vba(self):
-        """Begin generating the XML string based on the VBA tree."""
-        self._data = self._xml_head + self._generate_tag(self._browser)
-
-        # convert empty elements to a single tag
-        self._data = re.sub(r'></.*?>', ' />', self._data)
-
-    def _generate_tag(self, elem, tabs: int = 0, **kwargs) -> str:
-        """Recursively generate each element into a string.
-
-        Parameters
-        ----------
-        elem
-            The element to convert into an XML string.
-        tabs: int
-            The indentation level of the current element.
-
-        Returns
-        -------
-        str
-            The XML string of the element and sub-elements.
-        """
-
-        xml = ''
-        stack = kwargs.get('stack', [])
-
-        if isinstance(elem, Browser):
-            tag = XMLExport.Tag(elem.name)
-
-            # check if in stack already
-            if any(map(lambda obj: elem.cf(obj), stack)):
-                return tag.enclose('BrowserObject: See ancestors', tabs)
-            else:
-                stack.append(elem)
-
-            # setup the tag attributes
-            attrs = ["Name", "Count"]
-            [
-                tag.add_attr(attr, value)
-                for attr, value in elem.all.items()
-                if attr in attrs
-            ]
+        if type(text) in (int, float, bool):
+            return str(text)
+        text = str(text)
+        return text.translate(XMLExport.XML_ESCAPE_TABLE) if XMLExport.XML_ESCAPE_RE.search(text) else text
 
-            # add the element and start adding the sub-elements
-            xml += '\t' * tabs + tag.open_tag + '\n'
-            for item, value in elem.all.items():
-                if isinstance(value, list):
-                    item_tag = XMLExport.Tag("Item")
+    def _generate_vba(self, *minimize: bool) -> list:
+        """Return an XML string based on the VBA tree for each form, minimized or not."""
+        sinks = Traversal(self._browser).run(*[XMLSink(self._skip_func, self._skip_err, m) for m in minimize])
+        return [self._xml_head + ('' if m else '\n') + sink.data for m, sink in zip(minimize, sinks)]
 
-                    xml += '\t' * (tabs + 1) + item_tag.open_tag + '\n'
-                    for i in value:
-                        xml += self._generate_tag(i, tabs + 2, stack=stack)
-                    xml += '\t' * (tabs + 1) + item_tag.close_tag + '\n'
+    def _generate_dict(self, minimize: bool = False) -> str:
+        """Return the XML string based on the visited dictionary."""
+        t, n = ('', '') if minimize else ('\t', '\n')
 
-                elif item not in attrs:
-                    # overlook objects that point to themselves
-                    if item == elem.name:
-                        continue
-                    else:
-                        xml += self._generate_tag(value, tabs + 1, name=item, stack=stack)
-
-            xml += '\t' * tabs + tag.close_tag + '\n'
-
-        elif isinstance(elem, FunctionViewer):
-            if not self._skip_func:
-                # display the function and its properties
-                tag = XMLExport.Tag("Function", name=elem.name, args=len(elem.args))
-                xml += tag.enclose(str(elem)[26:], tabs)
-
-        elif isinstance(elem, com_error):
-            # display the error location and method
-            if not self._skip_err:
-                tag = XMLExport.Tag("Error")
-                xml += tag.enclose(self.xml_encode(str(elem)), tabs)
-
-        else:
-            # display the variable and value
-            tag = XMLExport.Tag(kwargs.get('name', 'Unknown'))
-            xml += tag.enclose(self.xml_encode(str(elem)), tabs)
-        return xml
-
-    def _generate_dict(self):
-        """Begin generating the XML string based on the visited dictionary."""
         # populate browser and copy visited
         self._browser.browse_all()
         visited2 = copy.copy(visited)
 
         tag = XMLExport.Tag(self._browser.name, count=len(visited2))
-        xml = self._xml_head + tag.open_tag + "\n"
+        xml = [self._xml_head, n, tag.open_tag, n]
 
         # iterate through dictionary
         for var, value in visited2.items():
             tag1 = XMLExport.Tag(var, count=len(value))
-            xml += "\t" + tag1.open_tag + "\n"
+            xml += [t, tag1.open_tag, n]
 
             # iterate through each list
             for item in value:
                 tag2 = XMLExport.Tag(item.name)
-                xml += "\t" * 2 + tag2.open_tag + "\n"
 
                 # add name attribute
                 if 'Name' in item.all:
-                    tag2.add_attr('Name', item.Name)
+                    tag2.add_attr('Name', item.all['Name'])
+                xml += [t * 2, tag2.open_tag, n]
 
                 # iterate through each browser in the list
                 for var2, value2 in item.all.items():
+                    if not isinstance(value2, (list, Browser, com_error, FunctionViewer)):
+                        # display the variable and value from the cached tag template
+                        open_tag, close_tag = XMLExport.Tag.template(var2)
+                        xml += [t * 3, open_tag, self.xml_encode(value2), close_tag, n]
+                        continue
+
                     tag3 = XMLExport.Tag(var2)
 
                     # add name attribute
                     if isinstance(value2, Browser) and 'Name' in value2.all:
-                        tag3.add_attr('Name', value2.Name)
+                        tag3.add_attr('Name', value2.all['Name'])
 
                     # check for a collection object
                     if isinstance(value2, list):
                         tag3.add_attr('count', len(value2))
-                        xml += "\t" * 3 + tag3.open_tag + "\n"
+                        xml += [t * 3, tag3.open_tag, n]
 
                         # iterate through the browser's collection
                         for item2 in value2:
@@ -243,11 +210,11 @@ class XMLExport(ExportStr):
 
                             # add name attribute
                             if isinstance(item2, Browser) and 'Name' in item2.all:
-                                tag4.add_attr('Name', item2.Name)
+                                tag4.add_attr('Name', item2.all['Name'])
 
-                            xml += tag4.enclose(item2.name if isinstance(item2, Browser) else item2, 4)
+                            xml.append(tag4.enclose(item2.name if isinstance(item2, Browser) else item2, 4, t, n))
 
-                        xml += "\t" * 3 + tag3.close_tag + "\n"
+                        xml += [t * 3, tag3.close_tag, n]
                     else:
                         if isinstance(value2, Browser):
                             output = 'BrowserObject'
@@ -255,20 +222,19 @@ class XMLExport(ExportStr):
                             if self._skip_err:
                                 continue
                             output = self.xml_encode(repr(value2))
-                        elif isinstance(value2, FunctionViewer):
+                        else:
                             if self._skip_func:
                                 continue
                             tag3 = XMLExport.Tag("Function", name=value2.name, args=len(value2.args))
                             output = str(value2)[26:]
-                        else:
-                            output = self.xml_encode(value2)
-                        xml += tag3.enclose(output, 3)
+                        xml.append(tag3.enclose(output, 3, t, n))
 
-                xml += "\t" * 2 + tag1.close_tag + "\n"
+                xml += [t * 2, tag2.close_tag, n]
 
-            xml += "\t" + tag1.close_tag + "\n"
+            xml += [t, tag1.close_tag, n]
 
-        self._data = xml + tag.close_tag
+        xml.append(tag.close_tag)
+        return "".join(xml)
 
     def save(self, name: str, path: str = '.\\', minimize: bool = False):
         """Save to a file."""
@@ -277,6 +243,8 @@ class XMLExport(ExportStr):
     class Tag:
         NAME_RE = re.compile(r'(^xml)|(^[0-9]*)', re.IGNORECASE)
 
+        __slots__ = ['_name', '_attrs', '_open_tag']
+
         def __init__(self, tag_name: str, **attrs):
             """Create and store XML tag information in the proper formatting.
 
@@ -292,6 +260,7 @@ class XMLExport(ExportStr):
                 self.format_name(key): value
                 for key, value in attrs.items()
             }
+            self._open_tag = None
 
         @property
         def name(self) -> str:
@@ -306,44 +275,84 @@ class XMLExport(ExportStr):
         @property
         def open_tag(self) -> str:
             """Return the formatted opening tag."""
-            tag = "<" + self._name
-            if len(self._attrs) > 0:
-                # add the attributes
-                tag += " " + " ".join(
-                    f'{key}="{XMLExport.xml_encode(value)}"'
-                    for key, value in self._attrs.items()
-                    if not isinstance(value, com_error)
-                )
-            return tag + ">"
+            if self._open_tag is None:
+                tag = "<" + self._name
+                if len(self._attrs) > 0:
+                    # add the attributes
+                    tag += " " + " ".join(
+                        f'{key}="{XMLExport.xml_encode(value)}"'
+                        for key, value in self._attrs.items()
+                        if not isinstance(value, com_error)
+                    )
+                self._open_tag = tag + ">"
+            return self._open_tag
 
         @property
         def close_tag(self) -> str:
             """Return the formatted closing tag."""
-            return f"</{self._name}>"
+            return "</" + self._name + ">"
+
+        @property
+        def empty_tag(self) -> str:
+            """Return the formatted self-closing tag."""
+            return self.open_tag[:-1] + " />"
+
+        @staticmethod
+        def template(tag_name: str) -> tuple:
+            """Return the opening and closing tags of an element without attributes."""
+            if type(tag_name) is str:
+                return XMLExport.Tag._template(tag_name)
+            return XMLExport.Tag._template.__wrapped__(tag_name)
 
         @staticmethod
         def format_name(text: str) -> str:
             """Return a string formatted to XML tag naming conventions."""
+            if type(text) is str:
+                return XMLExport.Tag._format_name(text)
+            return XMLExport.Tag._format_name.__wrapped__(text)
+
+        # only names are cached, in bounded caches, so values such as True and 1 are never confused
+        @staticmethod
+        @lru_cache(maxsize=4096)
+        def _template(tag_name: str) -> tuple:
+            name = XMLExport.Tag.format_name(tag_name)
+            return "<" + name + ">", "</" + name + ">"
+
+        @staticmethod
+        @lru_cache(maxsize=4096)
+        def _format_name(text: str) -> str:
             text = XMLExport.Tag.NAME_RE.sub('', text)
             return text.strip('!"#$%&\'()*+,-./:;<=>?@[\\]^_`{|}~')
 
-        def enclose(self, text: str, tabs: int):
+        def enclose(self, text: str, tabs: int, tab: str = "\t", newline: str = "\n"):
             """Return a string enclosed with the tag."""
-            return "\t" * tabs + self.open_tag + text + self.close_tag + "\n"
+            return tab * tabs + self.open_tag + text + "</" + self._name + ">" + newline
 
         def add_attr(self, attr: str, value):
             """Add an attribute to the tag."""
             attr = self.format_name(attr)
             self._attrs[attr] = value
+            self._open_tag = None
 
         def rm_attr(self, attr):
             """Remove and return a tag attribute."""
             attr = self.format_name(attr)
+            self._open_tag = None
             return self._attrs.pop(attr)
 
 
 class JSONExport(ExportStr):
     JSON_ESCAPE_CHARS = ["\b", "\f", "\n", "\r", "\t", "\"", "\\"]
+    JSON_ESCAPE_TABLE = str.maketrans({
+        "\b": "\\b",
+        "\f": "\\f",
+        "\n": "\\n",
+        "\r": "\\r",
+        "\t": "\\t",
+        "\"": "\\\"",
+        "\\": "\\\\",
+    })
+    JSON_ESCAPE_RE = re.compile(r'[\b\f\n\r\t"\\]')
 
     def __init__(self, browser: Browser, skip_func: bool = False, skip_err: bool = False, vba_form: bool = False):
         super(JSONExport, self).__init__(browser, skip_func, skip_err, vba_form)
@@ -351,159 +360,555 @@ class JSONExport(ExportStr):
     @staticmethod
     def json_encode(text: str) -> str:
         """Map special JSON characters to their encoded form in a given string."""
-        return "".join(
-            "\\" + c
-            if c in JSONExport.JSON_ESCAPE_CHARS else c
-            for c in str(text)
-        )
-
-    def _check(self):
-        """Check if the JSON string needs to be generated."""
-        if self._data is None:
-            self._data = self._generate_vba(self._browser) if self._vba_form else self._generate_dict()
-            self._data = re.sub(r',(?!\s*?[{\[\"\'\w])', '', self._data)
+        text = str(text)
+        return text.translate(JSONExport.JSON_ESCAPE_TABLE) if JSONExport.JSON_ESCAPE_RE.search(text) else text
 
-    def _generate_vba(self, elem, tabs: int = 0, **kwargs) -> str:
-        """Recursively generate each element into a string.
+    @staticmethod
+    def block(name: str, entries: list, tabs: int, tab: str = "\t", newline: str = "\n") -> str:
+        """Return a named list of entries, e.g. `{ "name": [ ... ]}`, without a trailing comma."""
+        indent = tab * tabs
+        if len(entries) == 0:
+            return f'{indent}{{ "{JSONExport.json_encode(name)}": [{newline}{indent}]}}'
+        return (
+            f'{indent}{{ "{JSONExport.json_encode(name)}": [{newline}'
+            + ("," + newline).join(entries) + newline
+            + indent + "]}"
+        )
 
-        Parameters
-        ----------
-        elem
-            The element to convert into an JSON string.
-        tabs: int
-            The indentation level of the current element.
-
-        Returns
-        -------
-        str
-            The JSON string of the element and sub-elements.
-        """
+    @staticmethod
+    def key(name: str) -> str:
+        """Return the opening of an entry, e.g. `{ "name": `."""
+        if type(name) is str:
+            return JSONExport._key(name)
+        return JSONExport._key.__wrapped__(name)
 
-        json = ''
-        stack = kwargs.get('stack', [])
+    # only names are cached, in a bounded cache, so values such as True and 1 are never confused
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _key(name: str) -> str:
+        return f"{{ \"{JSONExport.json_encode(name)}\": "
 
-        if isinstance(elem, Browser):
-            # check if in stack already
-            if any(map(lambda obj: elem.cf(obj), stack)):
-                return "\t" * tabs + f"{{ \"{self.json_encode(elem.name)}\": \"BrowserObject: See ancestors\" }},\n"
-            else:
-                stack.append(elem)
+    @staticmethod
+    def value_entry(name: str, value, tabs: int, tab: str = "\t") -> str:
+        """Return a `{ "name": value }` entry."""
+        if isinstance(value, bool):
+            value = "true" if value else "false"
+        elif isinstance(value, (int, float, complex)):
+            value = str(value)
+        else:
+            value = "\"" + JSONExport.json_encode(value) + "\""
 
-            # display the browser and its children
-            json += "\t" * tabs + f"{{ \"{self.json_encode(elem.name)}\": [\n"
+        return tab * tabs + JSONExport.key(name) + value + " }"
 
-            for item, value in elem.all.items():
-                if type(value) is list and len(value) > 0:
-                    json += "\t" * (tabs + 1) + "{ \"Item\": [\n"
-                    for i in value:
-                        json += self._generate_vba(i, tabs + 2, stack=stack)
-                    json += "\t" * (tabs + 1) + "]},\n"
-                else:
-                    json += self._generate_vba(value, tabs + 1, name=item, stack=stack)
-
-            json += "\t" * tabs + "]},\n"
-        elif isinstance(elem, FunctionViewer):
-            if not self._skip_func:
-                # display the function and its properties
-                json += "\t" * tabs + f"{{ \"{self.json_encode(elem.name)}\": [\n"
-                json += "\t" * (tabs + 1) + f"{{ \"name\": \"{self.json_encode(elem.name)}\" }},\n"
-                json += "\t" * (tabs + 1) + f"{{ \"args\": {self.json_encode(str(len(elem.args)))} }},\n"
-                json += "\t" * (tabs + 1) + f"{{ \"use\": \"{self.json_encode(str(elem)[26:])}\" }}\n"
-                json += "\t" * tabs + "]},\n"
-        elif isinstance(elem, com_error):
-            # display the error location and method
-            if not self._skip_err:
-                json += "\t" * tabs + "{ \"Error\": [\n"
-                try:
-                    json += "\t" * (tabs + 1) + f"{{ \"on\": \"{self.json_encode(str(elem.args[2][1]))}\" }},\n"
-                    json += "\t" * (tabs + 1) + f"{{ \"message\": \"{self.json_encode(str(elem.args[2][2]))}\" }}\n"
-                except TypeError:
-                    json += "\t" * (tabs + 1) + f"{{ \"message\": \"{self.json_encode(str(elem.args[2]))}\" }}\n"
-                except IndexError:
-                    json += "\t" * (tabs + 1) + f"{{ \"message\": \"{self.json_encode(str(elem))}\" }}\n"
-                json += "\t" * tabs + "]},\n"
-        else:
-            # display the variable and value
-            name = self.json_encode(kwargs.get('name', 'Unknown'))
+    @staticmethod
+    def function_entry(func: FunctionViewer, tabs: int, tab: str = "\t", newline: str = "\n") -> str:
+        """Return the entry of a function and its properties."""
+        indent = tab * (tabs + 1)
+        name = JSONExport.json_encode(func.name)
+        return JSONExport.block(func.name, [
+            f"{indent}{{ \"name\": \"{name}\" }}",
+            f"{indent}{{ \"args\": {len(func.args)} }}",
+            f"{indent}{{ \"use\": \"{JSONExport.json_encode(str(func)[26:])}\" }}",
+        ], tabs, tab, newline)
 
-            if isinstance(elem, bool):
-                elem = str(elem).lower()
-            elif not isinstance(elem, (int, float, complex)):
-                elem = f"\"{self.json_encode(str(elem))}\""
+    @staticmethod
+    def error_entry(error: com_error, tabs: int, tab: str = "\t", newline: str = "\n") -> str:
+        """Return the entry of an error with its location and message."""
+        indent = tab * (tabs + 1)
+        try:
+            entries = [
+                f"{indent}{{ \"on\": \"{JSONExport.json_encode(error.args[2][1])}\" }}",
+                f"{indent}{{ \"message\": \"{JSONExport.json_encode(error.args[2][2])}\" }}",
+            ]
+        except TypeError:
+            entries = [f"{indent}{{ \"message\": \"{JSONExport.json_encode(error.args[2])}\" }}"]
+        except IndexError:
+            entries = [f"{indent}{{ \"message\": \"{JSONExport.json_encode(error)}\" }}"]
+        return JSONExport.block("Error", entries, tabs, tab, newline)
 
-            json += "\t" * tabs + f"{{ \"{name}\": {elem} }},\n"
-        return json
+    def _generate_vba(self, *minimize: bool) -> list:
+        """Return a JSON string based on the VBA tree for each form, minimized or not."""
+        sinks = Traversal(self._browser).run(*[JSONSink(self._skip_func, self._skip_err, m) for m in minimize])
+        return [sink.data for sink in sinks]
 
-    def _generate_dict(self) -> str:
-        """Begin generating the JSON string based on the visited dictionary."""
+    def _generate_dict(self, minimize: bool = False) -> str:
+        """Return the JSON string based on the visited dictionary."""
+        t, n = ('', '') if minimize else ('\t', '\n')
 
         # populate browser and copy visited
         self._browser.browse_all()
         visited2 = copy.copy(visited)
-        json = f'{{ "{self._browser.name}": [\n'
+        types = []
 
         # iterate through dictionary items
         for var, value in visited2.items():
-            json += f'\t{{ "{var}": [\n'
+            items = []
 
             # iterate through each list
             for item in value:
-                json += f'\t\t{{ "{item.name}": [\n'
+                entries = []
 
                 # iterate through each browser in the list
                 for var2, value2 in item.all.items():
                     # check for a collection object
                     if isinstance(value2, list):
-                        json += f'\t\t\t{{ "{var2}": [\n'
-
                         # iterate through the browser's collection
-                        for item2 in value2:
-                            output = item2.name if isinstance(item2, Browser) else item2
-                            json += f'\t\t\t\t{{ "{output}": "BrowserObject" }},\n'
+                        entries.append(self.block(var2, [
+                            self.value_entry(item2.name if isinstance(item2, Browser) else item2, 'BrowserObject', 4, t)
+                            for item2 in value2
+                        ], 3, t, n))
+
+                    elif isinstance(value2, Browser):
+                        entries.append(self.value_entry(value2.name, 'BrowserObject', 3, t))
+
+                    elif isinstance(value2, com_error):
+                        if not self._skip_err:
+                            entries.append(self.error_entry(value2, 3, t, n))
+
+                    elif isinstance(value2, FunctionViewer):
+                        if not self._skip_func:
+                            entries.append(self.function_entry(value2, 3, t, n))
 
-                        json += '\t\t\t]},\n'
                     else:
-                        if isinstance(value2, Browser):
-                            json += f'\t\t\t{{ "{value2.name}": "BrowserObject" }},\n'
+                        # display the variable and value
+                        entries.append(self.value_entry(var2, value2, 3, t))
 
-                        elif isinstance(value2, com_error):
-                            if self._skip_err:
-                                continue
+                items.append(self.block(item.name, entries, 2, t, n))
 
-                            json += "\t\t\t{ \"Error\": [\n"
-                            try:
-                                json += f"\t\t\t\t{{ \"on\": \"{self.json_encode(str(value2.args[2][1]))}\" }},\n"
-                                json += f"\t\t\t\t{{ \"message\": \"{self.json_encode(str(value2.args[2][2]))}\" }}\n"
-                            except TypeError:
-                                json += f"\t\t\t\t{{ \"message\": \"{self.json_encode(str(value2.args[2]))}\" }}\n"
-                            except IndexError:
-                                json += f"\t\t\t\t{{ \"message\": \"{self.json_encode(str(value2))}\" }}\n"
-                            json += "\t\t\t]},\n"
+            types.append(self.block(var, items, 1, t, n))
 
-                        elif isinstance(value2, FunctionViewer):
-                            if self._skip_func:
-                                continue
-                            # display the function and its properties
-                            json += f"\t\t\t{{ \"{self.json_encode(value2.name)}\": [\n"
-                            json += f"\t\t\t\t{{ \"name\": \"{self.json_encode(value2.name)}\" }},\n"
-                            json += f"\t\t\t\t{{ \"args\": {self.json_encode(str(len(value2.args)))} }},\n"
-                            json += f"\t\t\t\t{{ \"use\": \"{self.json_encode(str(value2)[26:])}\" }}\n"
-                            json += "\t\t\t]},\n"
+        return self.block(self._browser.name, types, 0, t, n) + n
+
+
+class SQLiteExport:
+    def __init__(self, browser: Browser, skip_func: bool = False, skip_err: bool = False, batch_size: int = 10000):
+        """Write the visited dictionary into a normalized SQLite database.
+
+        The tables are `types`, `objects` (one row per visited browser), `properties` (one row per
+        value, object reference, function, or error), and `members` (the items of each collection).
+        Rows are inserted in batches inside a single transaction and the indexes are created last.
+
+        Parameters
+        ----------
+        browser: Browser
+            The object used to gather all variables.
+        skip_func: bool
+            Skips reporting any FunctionViewer instant.
+        skip_err: bool
+            Skips reporting any error.
+        batch_size: int
+            The number of rows inserted per `executemany` call.
+        """
+        self._browser = browser
+
+        self._skip_func = skip_func
+        self._skip_err = skip_err
+        self._batch_size = batch_size
+
+    def save(self, name: str, path: str = '.\\'):
+        """Save to a database file, replacing any tables written by a previous export."""
+        os.makedirs(path, exist_ok=True)
+
+        # populate browser and copy visited
+        self._browser.browse_all()
+        visited2 = copy.copy(visited)
 
+        with SQLiteExport.Writer(os.path.join(path, name + '.db'), self._batch_size) as writer:
+            # assign every visited browser an id first so references can be resolved
+            for var, value in visited2.items():
+                for item in value:
+                    writer.add_object(item)
+
+            for var, value in visited2.items():
+                for item in value:
+                    object_id = writer.object_id(item)
+
+                    for var2, value2 in item.all.items():
+                        if isinstance(value2, list):
+                            writer.add_property(object_id, var2, 'collection', len(value2))
+                            for position, item2 in enumerate(value2):
+                                writer.add_member(object_id, position, item2)
+                        elif isinstance(value2, com_error):
+                            if not self._skip_err:
+                                writer.add_property(object_id, var2, 'error', str(value2))
+                        elif isinstance(value2, FunctionViewer):
+                            if not self._skip_func:
+                                writer.add_property(object_id, var2, 'function', str(value2)[26:])
                         else:
-                            # display the variable and value
-                            name = self.json_encode(var2)
-                            elem = value2
+                            writer.add_property(object_id, var2, 'object' if isinstance(value2, Browser) else 'value',
+                                                value2)
+
+    class Writer:
+        SCHEMA = [
+            "DROP TABLE IF EXISTS members",
+            "DROP TABLE IF EXISTS properties",
+            "DROP TABLE IF EXISTS objects",
+            "DROP TABLE IF EXISTS types",
+            "CREATE TABLE types (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE)",
+            "CREATE TABLE objects (id INTEGER PRIMARY KEY, type_id INTEGER NOT NULL REFERENCES types (id), "
+            "name TEXT, com_name TEXT)",
+            "CREATE TABLE properties (object_id INTEGER NOT NULL REFERENCES objects (id), name TEXT NOT NULL, "
+            "kind TEXT NOT NULL, value, ref_id INTEGER REFERENCES objects (id))",
+            "CREATE TABLE members (collection_id INTEGER NOT NULL REFERENCES objects (id), "
+            "position INTEGER NOT NULL, item_id INTEGER REFERENCES objects (id), value)",
+        ]
+        INDEXES = [
+            "CREATE INDEX objects_type ON objects (type_id)",
+            "CREATE INDEX objects_com_name ON objects (com_name)",
+            "CREATE INDEX properties_object ON properties (object_id)",
+            "CREATE INDEX properties_name_value ON properties (name, value)",
+            "CREATE INDEX members_collection ON members (collection_id, position)",
+        ]
+        INSERTS = {
+            'types': "INSERT INTO types VALUES (?, ?)",
+            'objects': "INSERT INTO objects VALUES (?, ?, ?, ?)",
+            'properties': "INSERT INTO properties VALUES (?, ?, ?, ?, ?)",
+            'members': "INSERT INTO members VALUES (?, ?, ?, ?)",
+        }
+
+        def __init__(self, file: str, batch_size: int = 10000):
+            """Create the schema in a database file and buffer rows for batched inserts.
+
+            Use as a context manager; leaving it flushes the remaining rows, creates the indexes, and
+            commits the transaction.
+
+            Parameters
+            ----------
+            file: str
+                The path to the database file.
+            batch_size: int
+                The number of rows inserted per `executemany` call.
+            """
+            self._conn = sqlite3.connect(file)
+            self._batch_size = batch_size
+            self._rows = {table: [] for table in self.INSERTS}
+
+            self._types = {}
+            self._objects = {}
+            self._count = 0
+
+        def __enter__(self):
+            self._conn.execute("PRAGMA synchronous = OFF")
+            self._conn.execute("BEGIN")
+            for statement in self.SCHEMA:
+                self._conn.execute(statement)
+            return self
+
+        def __exit__(self, exc_type, exc_val, exc_tb):
+            try:
+                if exc_type is None:
+                    self.flush()
+                    for statement in self.INDEXES:
+                        self._conn.execute(statement)
+                    self._conn.commit()
+                else:
+                    self._conn.rollback()
+            finally:
+                self._conn.close()
+
+        @staticmethod
+        def convert(value):
+            """Return the value as a type SQLite can store."""
+            if value is None or isinstance(value, (bool, int, float, str, bytes)):
+                return value
+            return str(value)
+
+        def insert(self, table: str, row: tuple):
+            """Buffer a row and insert the batch once it is full."""
+            rows = self._rows[table]
+            rows.append(row)
+
+            if len(rows) >= self._batch_size:
+                self._conn.executemany(self.INSERTS[table], rows)
+                rows.clear()
+
+        def flush(self):
+            """Insert every buffered row."""
+            for table, rows in self._rows.items():
+                if len(rows) > 0:
+                    self._conn.executemany(self.INSERTS[table], rows)
+                    rows.clear()
+
+        def type_id(self, com_type: str) -> int:
+            """Return the id of a type, adding it if needed."""
+            if com_type not in self._types:
+                self._types[com_type] = len(self._types) + 1
+                self.insert('types', (self._types[com_type], com_type))
+            return self._types[com_type]
+
+        def object_id(self, browser: Browser):
+            """Return the id of an added browser or None."""
+            return self._objects.get(id(browser), (None,))[0]
+
+        def add_object(self, browser) -> int:
+            """Add a browser to the objects table and return its id."""
+            if id(browser) not in self._objects:
+                # drop the entry once the browser is freed (e.g. compacted when bounded) so its id is not reused
+                key, objects = id(browser), self._objects
+                self._objects[key] = (self._count + 1, weakref.ref(browser, lambda ref: objects.pop(key, None)))
+                self._count += 1
+
+                com_name = browser.all.get('Name')
+                self.insert('objects', (
+                    self._count,
+                    self.type_id(browser.type),
+                    browser.name,
+                    None if isinstance(com_name, BaseException) else self.convert(com_name),
+                ))
+            return self.object_id(browser)
+
+        def add_property(self, object_id: int, name: str, kind: str, value):
+            """Add a property row, linking browsers to their object id when known."""
+            if isinstance(value, (Browser, Record)):
+                self.insert('properties', (object_id, name, kind, value.name, self.object_id(value)))
+            else:
+                self.insert('properties', (object_id, name, kind, self.convert(value), None))
+
+        def add_member(self, collection_id: int, position: int, item):
+            """Add an item of a collection, linking browsers to their object id when known."""
+            if isinstance(item, (Browser, Record)):
+                self.insert('members', (collection_id, position, self.object_id(item), item.name))
+            else:
+                self.insert('members', (collection_id, position, None, self.convert(item)))
+
+
+class XMLSink(Sink):
+    ATTRS = ["Name", "Count"]
+
+    def __init__(self, skip_func: bool = False, skip_err: bool = False, minimize: bool = False):
+        """Build the VBA form of the XML string from traversal events.
+
+        Parameters
+        ----------
+        skip_func: bool
+            Skips reporting any FunctionViewer instant.
+        skip_err: bool
+            Skips reporting any error.
+        minimize: bool
+            A flag that determines if the string is built without newlines and tabs.
+        """
+        self._skip_func = skip_func
+        self._skip_err = skip_err
+        self._tab, self._newline = ('', '') if minimize else ('\t', '\n')
+
+        self._parts = []
+        self._frames = []
+
+    @property
+    def data(self) -> str:
+        """Return the XML elements (without the XML declaration)."""
+        return "".join(self._parts)
+
+    def _hidden(self, name: str) -> bool:
+        """Return True if an element is left out, i.e. an attribute or an object pointing to itself."""
+        if len(self._frames) == 0 or isinstance(self._frames[-1], list):
+            return False
+        return name in self.ATTRS or name == self._frames[-1].name
+
+    def _enclose(self, tag, text: str):
+        """Add an element, using a single tag if it is empty."""
+        if text == '':
+            self._parts.append(self._tab * len(self._frames) + tag.empty_tag + self._newline)
+        else:
+            self._parts.append(tag.enclose(text, len(self._frames), self._tab, self._newline))
+
+    def start(self):
+        self._parts = []
+        self._frames = []
+
+    def enter_node(self, name, node):
+        if self._hidden(name):
+            # attributes and objects pointing to themselves are not walked
+            return False
+
+        tag = XMLExport.Tag(node.name)
+        [
+            tag.add_attr(attr, value)
+            for attr, value in node.all.items()
+            if attr in self.ATTRS
+        ]
+        self._parts.append(self._tab * len(self._frames) + tag.open_tag + self._newline)
+        self._frames.append(node)
+
+    def leave_node(self, name, node):
+        self._frames.pop()
+        self._parts.append(self._tab * len(self._frames) + XMLExport.Tag(node.name).close_tag + self._newline)
+
+    def reference(self, name, node):
+        if not self._hidden(name):
+            self._enclose(XMLExport.Tag(node.name), 'BrowserObject: See ancestors')
+
+    def property(self, name, value):
+        if not self._hidden(name):
+            text = XMLExport.xml_encode(value)
+            if text == '':
+                self._enclose(XMLExport.Tag(name if name is not None else 'Unknown'), text)
+            else:
+                open_tag, close_tag = XMLExport.Tag.template(name if name is not None else 'Unknown')
+                self._parts.append(self._tab * len(self._frames) + open_tag + text + close_tag + self._newline)
+
+    def function(self, name, func):
+        if not self._skip_func and not self._hidden(name):
+            # display the function and its properties
+            self._enclose(XMLExport.Tag("Function", name=func.name, args=len(func.args)), str(func)[26:])
+
+    def error(self, name, error):
+        if not self._skip_err and not self._hidden(name):
+            # display the error location and method
+            self._enclose(XMLExport.Tag("Error"), XMLExport.xml_encode(error))
+
+    def enter_collection(self, name, items):
+        self._parts.append(self._tab * len(self._frames) + "<Item>" + self._newline)
+        self._frames.append(items)
+
+    def leave_collection(self, name, items):
+        self._frames.pop()
+        self._parts.append(self._tab * len(self._frames) + "</Item>" + self._newline)
+
+
+class JSONSink(Sink):
+    def __init__(self, skip_func: bool = False, skip_err: bool = False, minimize: bool = False):
+        """Build the VBA form of the JSON string from traversal events.
+
+        Parameters
+        ----------
+        skip_func: bool
+            Skips reporting any FunctionViewer instant.
+        skip_err: bool
+            Skips reporting any error.
+        minimize: bool
+            A flag that determines if the string is built without newlines and tabs.
+        """
+        self._skip_func = skip_func
+        self._skip_err = skip_err
+        self._tab, self._newline = ('', '') if minimize else ('\t', '\n')
+
+        # each frame holds the entries of an open node or collection
+        self._frames = [[]]
+
+    @property
+    def data(self) -> str:
+        """Return the JSON string."""
+        return ("," + self._newline).join(self._frames[0]) + self._newline
+
+    def start(self):
+        self._frames = [[]]
+
+    def _close(self, name: str):
+        """Close the innermost frame into a named entry of its parent."""
+        entries = self._frames.pop()
+        self._frames[-1].append(JSONExport.block(name, entries, len(self._frames) - 1, self._tab, self._newline))
+
+    def enter_node(self, name, node):
+        self._frames.append([])
+
+    def leave_node(self, name, node):
+        self._close(node.name)
+
+    def reference(self, name, node):
+        self._frames[-1].append(
+            JSONExport.value_entry(node.name, 'BrowserObject: See ancestors', len(self._frames) - 1, self._tab)
+        )
+
+    def property(self, name, value):
+        self._frames[-1].append(
+            JSONExport.value_entry(name if name is not None else 'Unknown', value, len(self._frames) - 1, self._tab)
+        )
+
+    def function(self, name, func):
+        if not self._skip_func:
+            self._frames[-1].append(
+                JSONExport.function_entry(func, len(self._frames) - 1, self._tab, self._newline)
+            )
+
+    def error(self, name, error):
+        if not self._skip_err:
+            self._frames[-1].append(
+                JSONExport.error_entry(error, len(self._frames) - 1, self._tab, self._newline)
+            )
+
+    def enter_collection(self, name, items):
+        if len(items) > 0:
+            self._frames.append([])
+        else:
+            self.property(name, items)
+
+    def leave_collection(self, name, items):
+        if len(items) > 0:
+            self._close("Item")
+
+
+class SQLiteSink(Sink):
+    def __init__(self, file: str, skip_func: bool = False, skip_err: bool = False, batch_size: int = 10000):
+        """Write the VBA tree into a SQLite database from traversal events.
+
+        The schema is the one used by `SQLiteExport`. Every traversed browser gets a row in `objects`,
+        and a reference to a browser already traversed is stored by name without an id.
+
+        Parameters
+        ----------
+        file: str
+            The path to the database file.
+        skip_func: bool
+            Skips reporting any FunctionViewer instant.
+        skip_err: bool
+            Skips reporting any error.
+        batch_size: int
+            The number of rows inserted per `executemany` call.
+        """
+        self._file = file
+        self._skip_func = skip_func
+        self._skip_err = skip_err
+        self._batch_size = batch_size
+
+        self._writer = None
+        self._frames = []
+
+    def start(self):
+        self._writer = SQLiteExport.Writer(self._file, self._batch_size).__enter__()
+        self._frames = []
+
+    def finish(self, error=None):
+        self._writer.__exit__(type(error) if error is not None else None, error, None)
+
+    def _add(self, name, kind: str, value):
+        """Add a value as a property of the current browser or a member of the current collection."""
+        if len(self._frames) == 0:
+            return
+
+        frame = self._frames[-1]
+        if isinstance(frame, list):
+            # collection frames are [owner id, next position]
+            self._writer.add_member(frame[0], frame[1], value)
+            frame[1] += 1
+        else:
+            self._writer.add_property(frame, name, kind, value)
+
+    def enter_node(self, name, node):
+        self._writer.add_object(node)
+        self._add(name, 'object', node)
+        self._frames.append(self._writer.object_id(node))
+
+    def leave_node(self, name, node):
+        self._frames.pop()
+
+    def reference(self, name, node):
+        self._add(name, 'object', node)
 
-                            if isinstance(value2, bool):
-                                elem = str(value2).lower()
-                            elif not isinstance(value2, (int, float, complex)):
-                                elem = f"\"{self.json_encode(str(value2))}\""
+    def property(self, name, value):
+        self._add(name, 'value', value)
 
-                            json += f"\t\t\t{{ \"{name}\": {elem} }},\n"
+    def function(self, name, func):
+        if not self._skip_func:
+            self._add(name, 'function', str(func)[26:])
 
-                json += '\t\t]},\n'
+    def error(self, name, error):
+        if not self._skip_err:
+            self._add(name, 'error', str(error))
 
-            json += '\t]},\n'
+    def enter_collection(self, name, items):
+        self._writer.add_property(self._frames[-1], name, 'collection', len(items))
+        self._frames.append([self._frames[-1], 0])
 
-        return json + ']}\n'
+    def leave_collection(self, name, items):
+        self._frames.pop()
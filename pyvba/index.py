@@ -0,0 +1,125 @@
+from pyvba.browser import Browser
+from pyvba.viewer import Viewer, FunctionViewer
+
+
+class Index:
+    def __init__(self, browser: Browser = None):
+        """Create an in-memory index over a browsed tree.
+
+        The index maps types, names, and property values to browsers so lookups do not walk the tree
+        or make COM calls. Only browsers that have already been generated are indexed by their
+        properties, so the tree is typically populated with `Browser.browse_all` first.
+
+        Parameters
+        ----------
+        browser: Browser
+            The root of the tree to index, if given.
+        """
+        self._types = {}
+        self._names = {}
+        self._values = {}
+        self._parents = {}
+        self._nodes = {}
+
+        if browser is not None:
+            self.add(browser)
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __contains__(self, node):
+        return id(node) in self._nodes
+
+    @property
+    def types(self) -> list:
+        """Return a list of the indexed types."""
+        return list(self._types)
+
+    def add(self, browser: Browser, parent: Browser = None):
+        """Index a browser and all of its generated descendents.
+
+        Parameters
+        ----------
+        browser: Browser
+            The browser to index.
+        parent: Browser
+            The parent of the browser, if any.
+        """
+        stack = [(browser, parent)]
+
+        while stack:
+            node, parent = stack.pop()
+            if id(node) in self._nodes:
+                continue
+
+            self._nodes[id(node)] = node
+            self._parents[id(node)] = parent
+            self._types.setdefault(node.type, []).append(node)
+
+            if not node.generated:
+                continue
+
+            for name, value in node.all.items():
+                if isinstance(value, list):
+                    stack.extend((item, node) for item in reversed(value) if isinstance(item, Browser))
+                elif isinstance(value, Browser):
+                    stack.append((value, node))
+                elif not isinstance(value, (Viewer, FunctionViewer, BaseException)):
+                    # the type is part of each key so True, 1, and 1.0 are kept apart
+                    try:
+                        if name == 'Name':
+                            self._names.setdefault((type(value), value), []).append(node)
+                        self._values.setdefault((name, type(value), value), []).append(node)
+                    except TypeError:
+                        # unhashable values cannot be looked up
+                        continue
+
+    def by_type(self, com_type: str) -> list:
+        """Return the browsers of a given type."""
+        return self._types.get(com_type, [])
+
+    def by_name(self, name) -> list:
+        """Return the browsers with a given `Name` property."""
+        try:
+            return self._names.get((type(name), name), [])
+        except TypeError:
+            return []
+
+    def where(self, prop: str, value) -> list:
+        """Return the browsers where a property has the given value, of the same type (`True` is not `1`)."""
+        try:
+            return self._values.get((prop, type(value), value), [])
+        except TypeError:
+            return []
+
+    def parent(self, node: Browser):
+        """Return the parent browser of an indexed browser."""
+        return self._parents[id(node)]
+
+    def ancestors(self, node: Browser) -> list:
+        """Return the ancestors of an indexed browser, nearest first."""
+        ancestors = []
+        node = self._parents[id(node)]
+
+        while node is not None:
+            ancestors.append(node)
+            node = self._parents.get(id(node))
+        return ancestors
+
+    def find(self, com_type: str = None, name=None, **props) -> list:
+        """Return the browsers matching every given type, name, and property value.
+
+        The smallest matching set is filtered by the others, e.g. `find('Pad', IsThin=True)`.
+        """
+        sets = [self.where(prop, value) for prop, value in props.items()]
+        if com_type is not None:
+            sets.append(self.by_type(com_type))
+        if name is not None:
+            sets.append(self.by_name(name))
+
+        if len(sets) == 0:
+            return list(self._nodes.values())
+
+        sets.sort(key=len)
+        others = [set(map(id, s)) for s in sets[1:]]
+        return [node for node in sets[0] if all(id(node) in s for s in others)]
@@ -0,0 +1,94 @@
+import json
+import os
+
+
+class SkipPolicy:
+    def __init__(self, threshold: float = 1.0, strikes: int = 3):
+        """Create a policy that skips members which are repeatedly slow or raise errors.
+
+        Members are tracked per COM type. Once a member of a type has gone over the latency threshold
+        or raised an error `strikes` times, it is skipped for the remaining instances of that type.
+
+        Parameters
+        ----------
+        threshold: float
+            The number of seconds a member may take before the call counts as a strike.
+        strikes: int
+            The number of slow or failing calls before a member is skipped.
+        """
+        self._threshold = threshold
+        self._strikes = strikes
+
+        self._counts = {}
+        self._skipped = {}
+
+    @property
+    def threshold(self) -> float:
+        """Return the latency threshold in seconds."""
+        return self._threshold
+
+    @property
+    def strikes(self) -> int:
+        """Return the number of strikes before a member is skipped."""
+        return self._strikes
+
+    @property
+    def report(self) -> dict:
+        """Return the skipped members in the form `{type: {member: reason}}`."""
+        return self._skipped
+
+    def skipped(self, com_type: str, member: str) -> bool:
+        """Return True if the member should be skipped for the given type."""
+        return member in self._skipped.get(com_type, {})
+
+    def record(self, com_type: str, member: str, elapsed: float, error: BaseException = None):
+        """Record a call to a member and skip it once it runs out of strikes.
+
+        Parameters
+        ----------
+        com_type: str
+            The type of the object the member belongs to.
+        member: str
+            The name of the property or method.
+        elapsed: float
+            The number of seconds the call took.
+        error: BaseException
+            The error raised by the call, if any.
+        """
+        if error is None and elapsed <= self._threshold:
+            return
+
+        key = (com_type, member)
+        self._counts[key] = self._counts.get(key, 0) + 1
+
+        if self._counts[key] >= self._strikes:
+            if error is not None:
+                reason = f"raised {type(error).__name__}: {error}"
+            else:
+                reason = f"took {elapsed:.3f}s (threshold {self._threshold}s)"
+            self._skipped.setdefault(com_type, {})[member] = reason
+
+    def clear(self):
+        """Forget all recorded calls and skipped members."""
+        self._counts = {}
+        self._skipped = {}
+
+    def save(self, name: str, path: str = '.\\'):
+        """Save the policy to a JSON file so later runs start with it."""
+        os.makedirs(path, exist_ok=True)
+        with open(os.path.join(path, name + '.json'), "w") as file:
+            json.dump({
+                'threshold': self._threshold,
+                'strikes': self._strikes,
+                'skipped': self._skipped,
+            }, file, indent='\t')
+
+    @staticmethod
+    def load(file: str):
+        """Return a policy loaded from a JSON file created by `SkipPolicy.save`."""
+        with open(file, "r") as f:
+            data = json.load(f)
+
+        policy = SkipPolicy(data['threshold'], data['strikes'])
+        policy._skipped = data['skipped']
+        return policy
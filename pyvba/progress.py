@@ -0,0 +1,136 @@
+import json
+import logging
+import sys
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class Progress:
+    def __init__(self, interval: float = 5.0):
+        """Track the throughput of browsing and report it to observers at an interval.
+
+        Counting is a few integer additions per browser, and the clock is only read once per browser,
+        so tracking can be left on for long browses.
+
+        Parameters
+        ----------
+        interval: float
+            The minimum number of seconds between reports.
+        """
+        self._interval = interval
+        self._observers = []
+        self._depth = 0
+        self.reset()
+
+    @property
+    def interval(self) -> float:
+        """Return the minimum number of seconds between reports."""
+        return self._interval
+
+    @interval.setter
+    def interval(self, value: float):
+        self._interval = value
+        self._next = self._start + value
+
+    @property
+    def observers(self) -> list:
+        """Return the callbacks that receive the metrics."""
+        return self._observers
+
+    @property
+    def metrics(self) -> dict:
+        """Return the current metrics."""
+        elapsed = time.monotonic() - self._start
+        return {
+            'time': time.time(),
+            'elapsed': round(elapsed, 3),
+            'nodes': self._nodes,
+            'properties': self._properties,
+            'errors': self._errors,
+            'queue': self._queue,
+            'nodes_per_sec': round(self._nodes / elapsed, 3) if elapsed > 0 else 0.0,
+            'done': self._depth == 0,
+        }
+
+    def reset(self):
+        """Reset the counters and the clock."""
+        self._nodes = 0
+        self._properties = 0
+        self._errors = 0
+        self._queue = 0
+        self._start = time.monotonic()
+        self._next = self._start + self._interval
+
+    def subscribe(self, callback):
+        """Add a callback that is called with the metrics dictionary."""
+        if callback not in self._observers:
+            self._observers.append(callback)
+
+    def unsubscribe(self, callback):
+        """Remove a callback."""
+        if callback in self._observers:
+            self._observers.remove(callback)
+
+    def begin(self):
+        """Mark the start of a browse; the outermost one resets the counters."""
+        if self._depth == 0:
+            self.reset()
+        self._depth += 1
+
+    def end(self):
+        """Mark the end of a browse; the outermost one sends a final report."""
+        self._depth -= 1
+        if self._depth == 0:
+            self.emit()
+
+    def node(self, properties: int, errors: int):
+        """Count a generated browser and report if the interval has passed."""
+        self._nodes += 1
+        self._properties += properties
+        self._errors += errors
+
+        if self._observers and time.monotonic() >= self._next:
+            self.emit()
+
+    def queue(self, change: int):
+        """Change the number of browsers waiting to be browsed."""
+        self._queue += change
+
+    def emit(self):
+        """Send the current metrics to every observer.
+
+        An observer that raises is logged and unsubscribed so reporting can never stop a browse.
+        """
+        self._next = time.monotonic() + self._interval
+        if self._observers:
+            metrics = self.metrics
+            for callback in list(self._observers):
+                try:
+                    callback(metrics)
+                except KeyboardInterrupt:
+                    raise
+                except BaseException:
+                    logger.exception("Progress observer %r failed and was unsubscribed.", callback)
+                    self.unsubscribe(callback)
+
+
+class JSONLinesLogger:
+    def __init__(self, stream=None):
+        """An observer that writes each report as a line of JSON.
+
+        Parameters
+        ----------
+        stream
+            A writable text stream or a file path to append to. The default is `sys.stderr`.
+        """
+        self._stream = stream if stream is not None else sys.stderr
+
+    def __call__(self, metrics: dict):
+        line = json.dumps(metrics) + '\n'
+        if isinstance(self._stream, str):
+            with open(self._stream, "a") as file:
+                file.write(line)
+        else:
+            self._stream.write(line)
+            self._stream.flush()
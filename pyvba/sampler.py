@@ -0,0 +1,79 @@
+import random
+from itertools import islice
+
+
+class Sampler:
+    METHODS = ['first', 'random', 'stratified']
+
+    def __init__(self, size: int, method: str = 'first', seed: int = None):
+        """Create a sampler that picks representative items from a collection.
+
+        Parameters
+        ----------
+        size: int
+            The maximum number of items to keep from each collection.
+        method: str
+            'first' keeps the first items, 'random' picks items at random, and 'stratified' picks items
+            round-robin across the item classes so every type is represented.
+        seed: int
+            The seed for the random and stratified methods.
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown sampling method '{method}'; expected one of {self.METHODS}.")
+        if size < 0:
+            raise ValueError(f"The sample size must be zero or more, not {size}.")
+
+        self._size = size
+        self._method = method
+        self._seed = seed
+
+    @property
+    def size(self) -> int:
+        """Return the maximum number of items kept from each collection."""
+        return self._size
+
+    @property
+    def method(self) -> str:
+        """Return the sampling method."""
+        return self._method
+
+    @property
+    def seed(self) -> int:
+        """Return the random seed."""
+        return self._seed
+
+    def select(self, collection, count: int) -> list:
+        """Return the sampled items of a collection in the form `[(index, item)]`, ordered by index.
+
+        Parameters
+        ----------
+        collection
+            An iterable COM collection.
+        count: int
+            The number of items in the collection.
+        """
+        if self._method == 'first' or count <= self._size:
+            return list(islice(enumerate(collection), self._size))
+
+        if self._size == 0:
+            return []
+
+        rand = random.Random(self._seed)
+        if self._method == 'random':
+            indices = set(rand.sample(range(count), self._size))
+            last = max(indices)
+            return [(i, item) for i, item in islice(enumerate(collection), last + 1) if i in indices]
+
+        # group the items by class and take one from each group in turn
+        groups = {}
+        for i, item in enumerate(collection):
+            groups.setdefault(type(item), []).append((i, item))
+        for group in groups.values():
+            rand.shuffle(group)
+
+        sample = []
+        while len(sample) < self._size and any(groups.values()):
+            for group in groups.values():
+                if len(group) > 0 and len(sample) < self._size:
+                    sample.append(group.pop())
+        return sorted(sample, key=lambda pair: pair[0])
@@ -0,0 +1,213 @@
+from win32com.universal import com_error
+
+from pyvba import browser as browsing
+from pyvba.browser import Browser, Record
+from pyvba.viewer import FunctionViewer
+
+
+class Sink:
+    """The base class for receiving traversal events.
+
+    Each event is called with the name of the element within its parent (None for the root and for collection
+    items) and the element itself. Override the events of interest; the rest are ignored. A sink that returns
+    False from `enter_node` receives no events for that browser's contents, nor its `leave_node`.
+    """
+
+    EVENTS = ['enter_node', 'leave_node', 'reference', 'property', 'function', 'error', 'enter_collection',
+              'leave_collection']
+
+    def start(self):
+        """Called before the first event."""
+        pass
+
+    def finish(self, error: BaseException = None):
+        """Called after the last event, with the error that stopped the traversal if any."""
+        pass
+
+    def enter_node(self, name: str, node: Browser):
+        """Called before the contents of a browser. Return False to leave the contents out."""
+        pass
+
+    def leave_node(self, name: str, node: Browser):
+        """Called after the contents of a browser."""
+        pass
+
+    def reference(self, name: str, node: Browser):
+        """Called for a browser that matches one already traversed, in place of its contents."""
+        pass
+
+    def property(self, name: str, value):
+        """Called for a plain value."""
+        pass
+
+    def function(self, name: str, func: FunctionViewer):
+        """Called for a FunctionViewer."""
+        pass
+
+    def error(self, name: str, error: com_error):
+        """Called for an error raised while reading a property."""
+        pass
+
+    def enter_collection(self, name: str, items: list):
+        """Called before the items of a collection."""
+        pass
+
+    def leave_collection(self, name: str, items: list):
+        """Called after the items of a collection."""
+        pass
+
+
+class StatsSink(Sink):
+    def __init__(self):
+        """Count the events of a traversal and the browsers of each type."""
+        self._stats = {event: 0 for event in self.EVENTS}
+        self._types = {}
+
+    @property
+    def stats(self) -> dict:
+        """Return the number of each event in the form `{event: count}`."""
+        return self._stats
+
+    @property
+    def types(self) -> dict:
+        """Return the number of browsers of each type in the form `{type: count}`."""
+        return self._types
+
+    def enter_node(self, name, node):
+        self._stats['enter_node'] += 1
+        self._types[node.type] = self._types.get(node.type, 0) + 1
+
+    def leave_node(self, name, node):
+        self._stats['leave_node'] += 1
+
+    def reference(self, name, node):
+        self._stats['reference'] += 1
+
+    def property(self, name, value):
+        self._stats['property'] += 1
+
+    def function(self, name, func):
+        self._stats['function'] += 1
+
+    def error(self, name, error):
+        self._stats['error'] += 1
+
+    def enter_collection(self, name, items):
+        self._stats['enter_collection'] += 1
+
+    def leave_collection(self, name, items):
+        self._stats['leave_collection'] += 1
+
+
+class Traversal:
+    def __init__(self, browser: Browser):
+        """Walk a browser tree once and send each element to any number of sinks.
+
+        The tree is walked in the VBA form. A browser matching one already traversed is reported as a
+        reference instead of being walked again. Each sink only compares against the browsers it entered,
+        and a browser left out by every sink is not walked, so its contents are never generated.
+
+        When browsing is bounded (see `Browser.bound`), each browser is replaced in its parent's `all` by a
+        `Record` once its events have been sent, so only the current path is held in full. Records are
+        walked as browsers holding only their plain values.
+
+        Parameters
+        ----------
+        browser: Browser
+            The root of the tree.
+        """
+        self._browser = browser
+        self._stack = []
+        self._handlers = {}
+
+    def run(self, *sinks: Sink):
+        """Traverse the tree, sending every event to each sink in order, and return the sinks."""
+        self._stack = []
+        self._handlers = {event: [getattr(sink, event) for sink in sinks] for event in Sink.EVENTS}
+
+        for sink in sinks:
+            sink.start()
+
+        try:
+            self._visit(self._browser, None, tuple(range(len(sinks))))
+        except BaseException as e:
+            for sink in sinks:
+                sink.finish(e)
+            raise
+
+        for sink in sinks:
+            sink.finish()
+        return sinks
+
+    def _emit(self, event: str, name, elem, active: tuple):
+        """Send an event to the active sinks, given by their positions."""
+        handlers = self._handlers[event]
+        for i in active:
+            handlers[i](name, elem)
+
+    def _enter(self, name, node: Browser, active: tuple) -> tuple:
+        """Send `enter_node` to the active sinks and return those that did not answer False."""
+        handlers = self._handlers['enter_node']
+        return tuple(i for i in active if handlers[i](name, node) is not False)
+
+    @staticmethod
+    def _compact(elem):
+        """Return a record to replace a consumed browser when bounded, otherwise None."""
+        if browsing.bounded and isinstance(elem, Browser):
+            return Record(elem)
+        return None
+
+    def _seen(self, node: Browser, active: tuple) -> tuple:
+        """Return the active sinks that have already entered a browser matching the node."""
+        remaining = set(active)
+        for obj, entered in self._stack:
+            if not remaining.isdisjoint(entered) and node.cf(obj):
+                remaining.difference_update(entered)
+                if not remaining:
+                    break
+        return tuple(i for i in active if i not in remaining)
+
+    def _visit(self, elem, name, active: tuple):
+        """Recursively emit the events for an element and its sub-elements to the active sinks.
+
+        Returns the record replacing a browser when bounded, otherwise None.
+        """
+        if isinstance(elem, (Browser, Record)):
+            # check if in stack already
+            seen = self._seen(elem, active)
+            if seen:
+                self._emit('reference', name, elem, seen)
+                active = tuple(i for i in active if i not in seen)
+
+            entered = self._enter(name, elem, active) if active else ()
+            if not entered:
+                return self._compact(elem)
+            self._stack.append((elem, entered))
+            index = len(self._stack) - 1
+
+            for item, value in elem.all.items():
+                if isinstance(value, list):
+                    self._emit('enter_collection', item, value, entered)
+                    for i, sub in enumerate(value):
+                        record = self._visit(sub, None, entered)
+                        if record is not None:
+                            value[i] = record
+                    self._emit('leave_collection', item, value, entered)
+                else:
+                    record = self._visit(value, item, entered)
+                    if record is not None:
+                        elem.all[item] = record
+            self._emit('leave_node', name, elem, entered)
+
+            record = self._compact(elem)
+            if record is not None:
+                self._stack[index] = (record, entered)
+                Browser._check_memory()
+            return record
+
+        elif isinstance(elem, FunctionViewer):
+            self._emit('function', name, elem, active)
+        elif isinstance(elem, com_error):
+            self._emit('error', name, elem, active)
+        else:
+            self._emit('property', name, elem, active)
@@ -2,13 +2,58 @@ import os
 import re
 import shutil
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from inspect import getfullargspec
+from types import MethodType
 
+import pythoncom
+from win32com.client import Dispatch
+from win32com.client.dynamic import CDispatch
 from win32com.client.gencache import EnsureDispatch
 
+from pyvba.sampler import Sampler
+
 # define regular expressions
 class_re = re.compile(r"(?<=\.)[^.]+?(?='>)")
 
+# cache how each class is handled by Viewer.gettype
+kinds = {}
+
+# limit the items wrapped from each collection; every item is wrapped if None
+sampler = None
+
+
+def _marshal(obj):
+    """Return a COM object packed for use on another thread, or the object itself if it is not COM."""
+    if hasattr(obj, '_oleobj_'):
+        return True, pythoncom.CoMarshalInterThreadInterfaceInStream(pythoncom.IID_IDispatch, obj._oleobj_)
+    return False, obj
+
+
+def _unmarshal(packed):
+    """Return the object packed by `_marshal` for use on the current thread."""
+    is_com, obj = packed
+    return Dispatch(pythoncom.CoGetInterfaceAndReleaseStream(obj, pythoncom.IID_IDispatch)) if is_com else obj
+
+
+def _apply(func, obj) -> tuple:
+    """Return `(result, error)` from calling the function on the object."""
+    try:
+        return func(obj), None
+    except KeyboardInterrupt:
+        raise
+    except BaseException as e:
+        return None, e
+
+
+def _apply_marshaled(func, packed) -> tuple:
+    """Run `_apply` on a worker thread, marshaling the object in and any COM result back out."""
+    obj, error = _apply(_unmarshal, packed)
+    if error is None:
+        result, error = _apply(func, obj)
+    return (None, error) if error is not None else _apply(_marshal, result)
+
 
 class Viewer:
     def __init__(self, app, name: str = None, parent: object = None):
@@ -68,15 +113,56 @@ class Viewer:
     @staticmethod
     def gettype(obj, item: str = None, parent: object = None):
         """Return the appropriate variable or Viewer instance."""
-        if '<bound method' in repr(obj):
+        kind = Viewer.kind(obj)
+
+        if kind == 'value':
+            return obj
+        elif kind == 'function':
             return FunctionViewer(obj, item)
-        elif 'win32com' in repr(obj) or 'COMObject' in repr(obj):
-            try:
-                _ = len(obj)
-                return CollectionViewer(obj, item, parent)
-            except (TypeError, AttributeError):
-                return Viewer(obj, item, parent)
-        return obj
+        return CollectionViewer(obj, item, parent) if kind == 'collection' else Viewer(obj, item, parent)
+
+    @staticmethod
+    def kind(obj) -> str:
+        """Return how `gettype` handles an object: 'value', 'function', 'collection', or 'object'."""
+        kind = kinds.get(type(obj))
+        if kind is None:
+            kind = kinds[type(obj)] = Viewer.classify(type(obj))
+
+        if kind == 'dispatch':
+            # dynamic dispatch objects share one class, so check each for a Count property
+            return 'collection' if obj._find_dispatch_type_('Count')[0] else 'object'
+        return kind
+
+    @staticmethod
+    def classify(cls) -> str:
+        """Return how `gettype` handles instances of a class.
+
+        Returns
+        -------
+        str
+            'function' for bound methods, 'collection' or 'object' for generated COM classes, 'dispatch' for
+            dynamic COM objects that are checked individually, and 'value' for everything else.
+        """
+        if issubclass(cls, MethodType):
+            return 'function'
+        elif issubclass(cls, CDispatch):
+            # checked before __len__, which every dynamic object defines
+            return 'dispatch'
+        elif not cls.__module__.startswith('win32com'):
+            return 'value'
+        return 'collection' if hasattr(cls, '__len__') else 'object'
+
+    @staticmethod
+    def sample(size: int, method: str = 'first', seed: int = None):
+        """Only wrap a sample of the items in each collection. See `Sampler` for the parameters."""
+        global sampler
+        sampler = Sampler(size, method, seed)
+
+    @staticmethod
+    def clr_sample():
+        """Wrap every item in each collection."""
+        global sampler
+        sampler = None
 
     def getattr(self, item):
         """Return a variable, FunctionViewer, or Viewer object."""
@@ -158,6 +244,8 @@ class FunctionViewer:
 
     def __call__(self, *args, **kwargs):
         """Calls the function and returns the function output."""
+        if self._func is None:
+            raise RuntimeError(f"The function '{self._name}' has been released.")
         return Viewer.gettype(self._func(*args, **kwargs))
 
     def __str__(self):
@@ -187,16 +275,28 @@ class FunctionViewer:
         """Alternative function call."""
         return self(*args, **kwargs)
 
+    def release(self):
+        """Drop the bound method, keeping only the name and arguments."""
+        self._func = None
+        self._fullargspec = None
+
 
 class CollectionViewer(Viewer):
     def __init__(self, obj, name: str = None, parent: object = None):
         super().__init__(obj, name, parent)
 
         self._count = len(self._com)
-        self._items = [
-            Viewer.gettype(i, name, self)
-            for i in self._com
-        ]
+        self._indices = None
+
+        if sampler is not None:
+            sample = sampler.select(self._com, self._count)
+            self._indices = [index for index, _ in sample]
+            self._items = [Viewer.gettype(i, name, self) for _, i in sample]
+        else:
+            self._items = [
+                Viewer.gettype(i, name, self)
+                for i in self._com
+            ]
 
     def __str__(self):
         return super().__str__().replace('Viewer', 'CollectionViewer')
@@ -217,6 +317,173 @@ class CollectionViewer(Viewer):
         """Return the items in the collection."""
         return self._items
 
+    @property
+    def sampled(self) -> bool:
+        """Return True if only a sample of the items was kept."""
+        return self._indices is not None and len(self._indices) < self._count
+
+    @property
+    def indices(self) -> list:
+        """Return the positions of the sampled items in the collection, or None if not sampled."""
+        return self._indices
+
     def item(self, index):
         """Return one of the items."""
         return self[index]
+
+    def columns(self, names, structured: bool = False):
+        """Return properties read across every item as NumPy masked arrays.
+
+        Each property is read straight from the COM object of every item without wrapping the results.
+        Missing values, `None`, and errors are masked. Tuples (SAFEARRAYs) of equal length become
+        two-dimensional columns, and columns mixing text with other kinds are kept as objects rather than
+        converted to strings. NumPy is required (`pip install pyvba[numpy]`).
+
+        Parameters
+        ----------
+        names
+            A property name or a list of property names.
+        structured: bool
+            A flag that determines if a single structured masked array is returned instead of a dict.
+
+        Returns
+        -------
+        dict or numpy.ma.MaskedArray
+            The columns in the form `{name: column}` or a structured array with one field per name.
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("CollectionViewer.columns requires NumPy (pip install pyvba[numpy]).") from None
+
+        names = [names] if isinstance(names, str) else list(names)
+        values = [[None] * len(self._items) for _ in names]
+        masks = numpy.zeros((len(names), len(self._items)), dtype=bool)
+
+        # read every property of an item while its COM object is at hand
+        for i, item in enumerate(self._items):
+            source = item.com if isinstance(item, Viewer) and item.com is not None else item
+            for j, name in enumerate(names):
+                try:
+                    value = getattr(source, name)
+                except KeyboardInterrupt:
+                    raise
+                except BaseException:
+                    masks[j, i] = True
+                    continue
+
+                if value is None or isinstance(value, BaseException):
+                    masks[j, i] = True
+                else:
+                    values[j][i] = value
+
+        cols = {name: self._column(numpy, values[j], masks[j]) for j, name in enumerate(names)}
+        if not structured:
+            return cols
+
+        dtype = numpy.dtype([(name, col.dtype, col.shape[1:]) for name, col in cols.items()])
+        data = numpy.empty(len(self._items), dtype=dtype)
+        mask = numpy.empty(len(self._items), dtype=numpy.ma.make_mask_descr(dtype))
+        for name, col in cols.items():
+            data[name] = col.data
+            mask[name] = numpy.ma.getmaskarray(col)
+        return numpy.ma.masked_array(data, mask=mask)
+
+    @staticmethod
+    def _column(numpy, values: list, mask):
+        """Return a masked array from a list of values, filling the masked entries with zeros."""
+        fill = next((value for value, masked in zip(values, mask) if not masked), None)
+        if fill is None:
+            return numpy.ma.masked_array(numpy.zeros(len(values)), mask=mask)
+
+        strings = [CollectionViewer._is_text(value) for value, masked in zip(values, mask) if not masked]
+        blank = numpy.zeros_like(numpy.asarray(fill))
+        values = [blank if masked else value for value, masked in zip(values, mask)]
+        try:
+            data = numpy.array(values)
+        except ValueError:
+            data = None
+
+        # ragged tuples, mixed shapes, and text mixed with other kinds are kept as objects
+        if data is None or (data.dtype.kind in 'US' and not all(strings)):
+            data = numpy.empty(len(values), dtype=object)
+            for i, value in enumerate(values):
+                data[i] = value
+
+        mask = numpy.broadcast_to(mask.reshape((-1,) + (1,) * (data.ndim - 1)), data.shape)
+        return numpy.ma.masked_array(data, mask=mask.copy())
+
+    @staticmethod
+    def _is_text(value) -> bool:
+        """Return True if the value is a string or a tuple made only of strings."""
+        if isinstance(value, tuple):
+            return all(CollectionViewer._is_text(i) for i in value)
+        return isinstance(value, str)
+
+    def map(self, method_name: str, *args, threads: int = None, wrap: bool = False, **kwargs):
+        """Call a method on every item and yield the results in order.
+
+        Parameters
+        ----------
+        method_name: str
+            The name of the method to call on each item.
+        args
+            The arguments passed to each call.
+        threads: int
+            The number of worker threads. Items are called one at a time on this thread if not given.
+        wrap: bool
+            A flag that determines if results are returned as Viewer instances where applicable.
+            COM results from worker threads are rewrapped with `win32com.client.Dispatch`, which uses the
+            generated class only if its type library is already cached, so they may be classified as
+            dynamic objects where the same call on this thread would return a generated one.
+        kwargs
+            The keyword arguments passed to each call.
+
+        Yields
+        ------
+        The result for each item, or the error it raised. Errors are also stored in `errors`.
+        """
+        return self._bulk(lambda obj: getattr(obj, method_name)(*args, **kwargs), method_name, threads, wrap)
+
+    def pluck(self, property_name: str, threads: int = None, wrap: bool = False):
+        """Read a property from every item and yield the values in order.
+
+        See `CollectionViewer.map` for the parameters.
+        """
+        return self._bulk(lambda obj: getattr(obj, property_name), property_name, threads, wrap)
+
+    def _bulk(self, func, name: str, threads: int = None, wrap: bool = False):
+        """Apply a function to the COM object of every item, optionally on a bounded thread pool."""
+        sources = [item.com if isinstance(item, Viewer) and item.com is not None else item for item in self._items]
+
+        if not threads:
+            for index, obj in enumerate(sources):
+                yield self._bulk_result(index, name, wrap, *_apply(func, obj))
+            return
+
+        # keep a bounded window of calls in flight so results stream back in order
+        with ThreadPoolExecutor(threads, initializer=pythoncom.CoInitialize) as pool:
+            pending = deque()
+            for index, obj in enumerate(sources):
+                pending.append((index, pool.submit(_apply_marshaled, func, _marshal(obj))))
+
+                if len(pending) >= threads * 2:
+                    index, future = pending.popleft()
+                    yield self._bulk_result(index, name, wrap, *self._bulk_unmarshal(future))
+
+            while pending:
+                index, future = pending.popleft()
+                yield self._bulk_result(index, name, wrap, *self._bulk_unmarshal(future))
+
+    @staticmethod
+    def _bulk_unmarshal(future) -> tuple:
+        """Return `(result, error)` from a worker, unmarshaling a COM result for use on this thread."""
+        result, error = future.result()
+        return (None, error) if error is not None else _apply(_unmarshal, result)
+
+    def _bulk_result(self, index: int, name: str, wrap: bool, result, error):
+        """Return the result of a bulk call, recording any error against the item."""
+        if error is not None:
+            self._errors[f"{name}[{index}]"] = error
+            return error
+        return Viewer.gettype(result, name, self) if wrap else result
@@ -21,5 +21,6 @@ setuptools.setup(
         "Programming Language :: Python :: 3.7",
     ],
     install_requires=['pywin32'],
+    extras_require={'numpy': ['numpy']},
     python_requires='>=3.7',
 )
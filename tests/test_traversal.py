@@ -0,0 +1,73 @@
+import unittest
+
+from pyvba.browser import Browser, Record
+from pyvba.export import XMLExport, XMLSink
+from pyvba.traversal import StatsSink, Traversal
+
+
+def node(name: str, com_type: str, **values) -> Browser:
+    """Return a browser holding the given values, without a COM object behind it."""
+    browser = Browser.__new__(Browser)
+    browser.__dict__.update(
+        _com=None, _name=name, _type=com_type, _parent=None, _objects=list(values), _methods=[], _errors={},
+        _all=values, _released=False,
+    )
+    return browser
+
+
+class TestHiddenSubtrees(unittest.TestCase):
+    def setUp(self):
+        # the Name attribute holds a browser whose subtree matches a visible sibling
+        self.sub = node("Sub", "Document", Leaf=node("Leaf", "Pad", V=1))
+        self.leaf = node("Leaf", "Pad", V=1)
+        self.root = node("App", "Application", Name=self.sub, Leaf=self.leaf)
+
+    def test_xml_matches_previous_exporter(self):
+        expected = (
+            '<App Name="&lt;class &apos;Browser&apos;&gt;: Sub">\n'
+            '\t<Leaf>\n'
+            '\t\t<V>1</V>\n'
+            '\t</Leaf>\n'
+            '</App>\n'
+        )
+        export = XMLExport(self.root, vba_form=True)
+        self.assertEqual(export.data_str, export._xml_head + '\n' + expected)
+
+    def test_hidden_subtree_is_not_walked(self):
+        traversal = Traversal(self.root)
+        traversal.run(XMLSink())
+        self.assertEqual([obj.name for obj, _ in traversal._stack], ["App", "Leaf"])
+
+    def test_sinks_compare_against_their_own_entries(self):
+        stats, xml = Traversal(self.root).run(StatsSink(), XMLSink())
+        self.assertEqual(stats.stats['reference'], 1)
+        self.assertNotIn('See ancestors', xml.data)
+
+
+class TestBoundedTraversal(unittest.TestCase):
+    def setUp(self):
+        self.items = [node(f"Pad.{i}", "Pad", V=i, Sub=node("Sub", "Document", W=i)) for i in range(3)]
+        self.root = node("App", "Application", Title="t", Pads=self.items)
+
+    def tearDown(self):
+        Browser.unbound()
+
+    def test_output_matches_unbounded(self):
+        expected = XMLExport(node("App", "Application", Title="t", Pads=[
+            node(f"Pad.{i}", "Pad", V=i, Sub=node("Sub", "Document", W=i)) for i in range(3)
+        ]), vba_form=True).data_str
+
+        Browser.bound()
+        self.assertEqual(XMLExport(self.root, vba_form=True).data_str, expected)
+
+    def test_consumed_browsers_become_records(self):
+        Browser.bound()
+        Traversal(self.root).run(XMLSink())
+
+        pads = self.root.all['Pads']
+        self.assertTrue(all(isinstance(pad, Record) for pad in pads))
+        self.assertEqual(pads[1].all, {'V': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()